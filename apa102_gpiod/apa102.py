@@ -7,12 +7,26 @@ APA102 LEDs using libgpiod.
 See LICENSE.txt for details.
 """
 import gpiod
+import math
+import time
 import typing
 
 import collections
+import operator
+from array import array
 from collections.abc import Sequence
 
 LedOutput = collections.namedtuple('LedOutput', ('brt', 'r', 'g', 'b'))
+CommitStats = collections.namedtuple('CommitStats',
+                                     ('bits', 'elapsed_ns', 'bitrate',
+                                      'period_min_ns', 'period_max_ns',
+                                      'jitter_ns'))
+
+try:
+    _perf_counter_ns = time.perf_counter_ns
+except AttributeError:  # Python 3.6
+    def _perf_counter_ns() -> int:
+        return int(time.perf_counter() * 1e9)
 
 APA102_START = b'\x00\x00\x00\x00'  # APA102 start sequence, 4 bytes of zeroes
 
@@ -96,6 +110,45 @@ def _pack_brgb(o: LedOutput) -> bytes:
     return arr
 
 
+def _half_period_from_bitrate(bitrate: float) -> int:
+    """
+    Convert a target bit rate to the minimum clock half-period that does not
+    exceed it.
+
+    :param bitrate: target bit rate, in bits per second.
+    :return: minimum clock half-period, in nanoseconds.
+    :raises ValueError: on non-positive bit rates.
+    """
+    if not (bitrate > 0):
+        raise ValueError(f'bit rate invalid: got {bitrate!r}, '
+                         'expected positive value')
+    return math.ceil(1e9 / (2 * bitrate))
+
+
+def _commit_stats(bits: int, elapsed_ns: int,
+                  rising: typing.Optional[typing.Sequence[int]] = None
+                  ) -> CommitStats:
+    """
+    Compute timing statistics for a commit.
+
+    :param bits: number of bits clocked out.
+    :param elapsed_ns: time taken to clock out all bits, in nanoseconds.
+    :param rising: timestamps of each rising clock edge, in nanoseconds, or
+                   ``None`` if edge timing was not measured.
+    :return: CommitStats named tuple. Per-period statistics are ``None`` if
+             edge timing was not measured.
+    """
+    bitrate = (bits * 1e9 / elapsed_ns) if elapsed_ns else None
+    if rising is None or len(rising) < 2:
+        return CommitStats(bits, elapsed_ns, bitrate, None, None, None)
+
+    periods = [b - a for (a, b) in zip(rising, rising[1:])]
+    mean = (rising[-1] - rising[0]) / len(periods)
+    jitter = math.sqrt(sum((p - mean) ** 2 for p in periods) / len(periods))
+    return CommitStats(bits, elapsed_ns, bitrate,
+                       min(periods), max(periods), jitter)
+
+
 def _ledoutput_from_led_command(command: typing.Sequence[int]) -> LedOutput:
     """
     Convert a 4-byte LED output command sequence to a LedOutput object.
@@ -111,7 +164,9 @@ class APA102(Sequence):
     Class used to control APA102 leds using libgpiod.
     """
 
-    def __init__(self, chip: str, leds: int, clk: int, data: int, reset=False):
+    def __init__(self, chip: str, leds: int, clk: int, data: int, reset=False,
+                 bitrate: typing.Optional[float] = None,
+                 half_period_ns: int = 0):
         """
         Initialize a APA102 led controller.
 
@@ -121,10 +176,23 @@ class APA102(Sequence):
         :param clk: clock gpio line.
         :param data: data gpio line.
         :param reset: whether to reset LEDs to the off state on startup.
+        :param bitrate: target bit rate, in bits per second. Mutually
+                        exclusive with ``half_period_ns``.
+        :param half_period_ns: minimum clock half-period, in nanoseconds.
+                               ``0`` clocks out data as fast as possible.
         :raises OSError: on inability to acquire control of I/O lines.
+        :raises ValueError: on invalid or conflicting pacing settings.
         """
         self._leds = leds
 
+        if bitrate is not None:
+            if half_period_ns:
+                raise ValueError(f'{self.__class__.__name__}: bitrate and '
+                                 'half_period_ns are mutually exclusive')
+            self.bitrate = bitrate
+        else:
+            self.half_period_ns = half_period_ns
+
         self._chip = gpiod.Chip(chip, gpiod.Chip.OPEN_BY_PATH)
         self._lines = self._chip.get_lines((clk, data))
         self._lines.request(f'apa102_gpiod',
@@ -193,18 +261,116 @@ class APA102(Sequence):
         else:
             return False
 
-    def commit(self) -> None:
+    def snapshot(self) -> bytes:
+        """
+        Obtain an immutable copy of the output settings of all LEDs.
+
+        The copy holds the packed 4-byte LED commands, in chain order, and is
+        meant to be compared against later states using ``diff()``.
+
+        :return: snapshot of the output settings of all LEDs.
+        """
+        return bytes(self._view[4:4 + (self._leds * 4)])
+
+    def diff(self, snapshot: bytes) -> typing.List[range]:
+        """
+        Obtain the indices of LEDs whose output settings differ from those in
+        a snapshot.
+
+        LED commands are compared in bulk as packed 4-byte words, so this is
+        cheap enough to call for every frame on long chains.
+
+        :param snapshot: snapshot obtained through ``snapshot()``.
+        :return: list of ascending, non-overlapping ranges of LED indices whose
+                 outputs differ from the snapshot.
+        :raises ValueError: on snapshot not matching the number of LEDs.
+        """
+        payload = self._view[4:4 + (self._leds * 4)]
+        if len(snapshot) != len(payload):
+            raise ValueError(f'{self.__class__.__name__}: snapshot invalid: '
+                             f'got {len(snapshot)} bytes, expected '
+                             f'{len(payload)} bytes')
+        if payload.tobytes() == snapshot:
+            return []
+
+        # One byte per LED, 1 if changed. Runs of changes are then located
+        # with bytes.find(), keeping the Python-level loop per-run.
+        changed = bytes(map(operator.ne, payload.cast('I'),
+                            memoryview(snapshot).cast('I')))
+        ranges = []
+        end = 0
+        while True:
+            start = changed.find(1, end)
+            if start < 0:
+                return ranges
+            end = changed.find(0, start)
+            if end < 0:
+                end = len(changed)
+            ranges.append(range(start, end))
+
+    @property
+    def half_period_ns(self) -> int:
+        """
+        Minimum clock half-period used when committing, in nanoseconds.
+
+        ``0`` disables pacing, clocking out data as fast as possible.
+
+        :raises ValueError: on setting a negative or non-integer value.
+        """
+        return self._half_period_ns
+
+    @half_period_ns.setter
+    def half_period_ns(self, half_period_ns: int) -> None:
+        if not (isinstance(half_period_ns, int) and half_period_ns >= 0):
+            raise ValueError(f'{self.__class__.__name__}: half-period invalid: '
+                             f'got {half_period_ns!r}, expected non-negative '
+                             'integer')
+        self._half_period_ns = half_period_ns
+
+    @property
+    def bitrate(self) -> typing.Optional[float]:
+        """
+        Maximum bit rate used when committing, in bits per second.
+
+        ``None`` if pacing is disabled. Setting ``None`` disables pacing.
+
+        :raises ValueError: on setting a non-positive value.
+        """
+        if not self._half_period_ns:
+            return None
+        return 1e9 / (2 * self._half_period_ns)
+
+    @bitrate.setter
+    def bitrate(self, bitrate: typing.Optional[float]) -> None:
+        try:
+            self.half_period_ns = (0 if bitrate is None
+                                   else _half_period_from_bitrate(bitrate))
+        except ValueError as e:
+            raise ValueError(f'{self.__class__.__name__}: {e}') from None
+
+    def commit(self) -> CommitStats:
         """
         Commits the output states to the actual LEDs
 
+        If pacing is enabled, each clock half-period lasts at least
+        ``half_period_ns``, enforced by busy-waiting on a monotonic
+        high-resolution clock.
+
+        :return: CommitStats named tuple describing the achieved bit rate.
+                 Clock period statistics are only measured when pacing is
+                 enabled, and are ``None`` otherwise.
         :raises OSError: on commit failure
 
         .. note::
 
             Undefined once the object has been ``close()``'d
         """
+        if self._half_period_ns:
+            return self._commit_paced()
+
         set_values = self._lines.set_values
         data = self._data
+        start = _perf_counter_ns()
         for i in range(len(data)):
             byte = data[i]
             bit = ((byte >> 7) & 0x01)
@@ -231,6 +397,40 @@ class APA102(Sequence):
             bit = ((byte >> 0) & 0x01)
             set_values((0, bit))
             set_values((1, bit))
+        return _commit_stats(len(data) * 8, _perf_counter_ns() - start)
+
+    def _commit_paced(self) -> CommitStats:
+        """
+        Commits the output states to the actual LEDs, waiting at least
+        ``half_period_ns`` between each clock edge.
+
+        Each wait is measured from the previous edge rather than from a fixed
+        schedule, so that a delayed edge (e.g. through preemption) is never
+        followed by a burst of shorter periods.
+
+        :return: CommitStats named tuple describing the achieved timing.
+        :raises OSError: on commit failure
+        """
+        set_values = self._lines.set_values
+        clock = _perf_counter_ns
+        half = self._half_period_ns
+        rising = array('q')
+        append = rising.append
+
+        start = edge = clock()
+        for byte in self._data:
+            for shift in (7, 6, 5, 4, 3, 2, 1, 0):
+                bit = ((byte >> shift) & 0x01)
+                while clock() - edge < half:
+                    pass
+                set_values((0, bit))
+                edge = clock()
+                while clock() - edge < half:
+                    pass
+                set_values((1, bit))
+                edge = clock()
+                append(edge)
+        return _commit_stats(len(rising), edge - start, rising)
 
     def close(self) -> None:
         """
@@ -87,6 +87,32 @@ class TestMiscFunctions(unittest.TestCase):
         unpacked = apa102._ledoutput_from_led_command(packed)
         self.assertEquals(unpacked, output)
 
+    def test_half_period_from_bitrate_never_exceeds_target_bitrate(self):
+        for bitrate in (1, 3, 7000, 14000, 333333, 10 ** 9 // 2):
+            half_period = apa102._half_period_from_bitrate(bitrate)
+            self.assertIsInstance(half_period, int)
+            self.assertLessEqual(1e9 / (2 * half_period), bitrate)
+        for bitrate in (0, -1):
+            with self.assertRaisesRegex(ValueError, 'bit rate invalid'):
+                apa102._half_period_from_bitrate(bitrate)
+
+    def test_commit_stats_returns_correct_statistics(self):
+        stats = apa102._commit_stats(4, 400, [0, 100, 300, 400])
+        self.assertEqual(stats.bits, 4)
+        self.assertEqual(stats.elapsed_ns, 400)
+        self.assertAlmostEqual(stats.bitrate, 1e7)
+        self.assertEqual(stats.period_min_ns, 100)
+        self.assertEqual(stats.period_max_ns, 200)
+        self.assertAlmostEqual(stats.jitter_ns, (2 * (100 / 3) ** 2
+                                                 + (200 / 3) ** 2
+                                                 ) ** 0.5 / 3 ** 0.5)
+
+        stats = apa102._commit_stats(4, 400)
+        self.assertAlmostEqual(stats.bitrate, 1e7)
+        self.assertIsNone(stats.period_min_ns)
+        self.assertIsNone(stats.period_max_ns)
+        self.assertIsNone(stats.jitter_ns)
+
 
 class TestAPA102(unittest.TestCase):
     """
@@ -243,6 +269,101 @@ class TestAPA102(unittest.TestCase):
             bits_read // 8, byteorder='big', signed=False)
         self.assertSequenceEqual(payload_sent_bytes, payload, bytes)
 
+    def test_commit_method_paced_correctly_commits_framebuffer_to_leds(self):
+        waveform = []
+
+        def record_line_state(state):
+            waveform.append((state[0], state[1]))
+
+        self.mock_chip.return_value.get_lines.return_value.set_values. \
+            side_effect = record_line_state
+        self.instance[0] = apa102.LedOutput(0x0f, 0xde, 0xad, 0xbe)
+        self.instance.half_period_ns = 1000
+        stats = self.instance.commit()
+        payload = (apa102.APA102_START + b''.join([apa102._pack_brgb(o)
+                                                   for o in self.instance])
+                   + apa102._generate_end_sequence(len(self.instance)))
+
+        payload_sent = 0
+        bits_read = 0
+        for t, (clock, data) in enumerate(waveform):
+            if clock:
+                self.assertEqual(waveform[t - 1], (0, data))
+                payload_sent <<= 1
+                payload_sent |= data
+                bits_read += 1
+        payload_sent_bytes = payload_sent.to_bytes(
+            bits_read // 8, byteorder='big', signed=False)
+        self.assertSequenceEqual(payload_sent_bytes, payload, bytes)
+
+        self.assertEqual(stats.bits, len(payload) * 8)
+        self.assertGreaterEqual(stats.period_min_ns, 2000)
+        self.assertGreaterEqual(stats.period_max_ns, stats.period_min_ns)
+        self.assertGreaterEqual(stats.jitter_ns, 0)
+        self.assertLessEqual(stats.bitrate, self.instance.bitrate)
+
+    def test_commit_method_unpaced_returns_bitrate_only(self):
+        stats = self.instance.commit()
+        self.assertEqual(stats.bits, len(self.instance._data) * 8)
+        self.assertIsNone(stats.jitter_ns)
+
+    def test_pacing_settings_are_validated_and_convertible(self):
+        self.assertEqual(self.instance.half_period_ns, 0)
+        self.assertIsNone(self.instance.bitrate)
+        self.instance.bitrate = 250000
+        self.assertEqual(self.instance.half_period_ns, 2000)
+        self.assertAlmostEqual(self.instance.bitrate, 250000)
+        self.instance.bitrate = None
+        self.assertEqual(self.instance.half_period_ns, 0)
+        for invalid in (-1, 1.5):
+            with self.assertRaisesRegex(ValueError, 'half-period invalid'):
+                self.instance.half_period_ns = invalid
+        with self.assertRaisesRegex(ValueError, 'bit rate invalid'):
+            self.instance.bitrate = 0
+
+        with patch('apa102_gpiod.apa102.gpiod.Chip', autospec=True,
+                   spec_set=True) as __:
+            instance = apa102.APA102('/dev/gpiochip0', 8, 24, 23,
+                                     bitrate=500000)
+            self.assertEqual(instance.half_period_ns, 1000)
+            instance = apa102.APA102('/dev/gpiochip0', 8, 24, 23,
+                                     half_period_ns=500)
+            self.assertEqual(instance.half_period_ns, 500)
+            with self.assertRaisesRegex(ValueError, 'mutually exclusive'):
+                apa102.APA102('/dev/gpiochip0', 8, 24, 23,
+                              bitrate=500000, half_period_ns=500)
+
+    def test_snapshot_method_returns_immutable_copy_of_led_commands(self):
+        self.instance[1] = apa102.LedOutput(0x0f, 0xde, 0xad, 0xbe)
+        snapshot = self.instance.snapshot()
+        self.assertIsInstance(snapshot, bytes)
+        self.assertSequenceEqual(snapshot, b''.join(
+            [apa102._pack_brgb(o) for o in self.instance]))
+        self.instance[1] = apa102.LedOutput(0, 0, 0, 0)
+        self.assertSequenceEqual(snapshot[4:8], b'\xef\xbe\xad\xde')
+
+    def test_diff_method_returns_changed_led_ranges(self):
+        snapshot = self.instance.snapshot()
+        self.assertEqual(self.instance.diff(snapshot), [])
+
+        output = apa102.LedOutput(1, 2, 3, 4)
+        for i in (0, 2, 3, 4, 7):
+            self.instance[i] = output
+        self.assertEqual(self.instance.diff(snapshot),
+                         [range(0, 1), range(2, 5), range(7, 8)])
+
+        # Changes confined to a single byte of a command are detected.
+        snapshot = self.instance.snapshot()
+        self.instance[5] = apa102.LedOutput(0, 0, 0, 1)
+        self.assertEqual(self.instance.diff(snapshot), [range(5, 6)])
+
+        # Reverting changes is detected as no change.
+        self.instance[5] = apa102.LedOutput(0, 0, 0, 0)
+        self.assertEqual(self.instance.diff(snapshot), [])
+
+        with self.assertRaisesRegex(ValueError, 'snapshot invalid'):
+            self.instance.diff(snapshot[:-4])
+
     def test_close_method_correctly_releases_resources(self):
         self.instance.close()
         self.mock_chip.return_value.get_lines.return_value.release. \